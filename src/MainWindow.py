@@ -1,16 +1,18 @@
 import logging
 import os
-import random
+import queue
+import time
 import webbrowser
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QShowEvent, QFont, QColor, QPalette
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import numpy as np
+from PySide6.QtCore import QSignalBlocker, Qt, QThread, QTimer, Signal
+from PySide6.QtGui import QShowEvent, QFont, QPalette
 from PySide6.QtWidgets import (
     QMainWindow,
+    QHeaderView,
     QMessageBox,
-    QTableWidgetItem,
     QTextEdit,
     QHBoxLayout,
     QVBoxLayout,
@@ -18,7 +20,6 @@ from PySide6.QtWidgets import (
     QSpacerItem,
     QSizePolicy,
 )
-from PySide6.QtWidgets import QMainWindow, QMessageBox, QTableWidgetItem, QTextEdit, QHBoxLayout, QVBoxLayout
 from src.SettingsForm import SettingsForm
 from src.MainWindow_ui import Ui_MainWindow
 from src.appdata import AppDataPaths
@@ -28,6 +29,7 @@ from src.device_launch_monitor_bluetooth_r10 import DeviceLaunchMonitorBluetooth
 from src.device_launch_monitor_relay_server import DeviceLaunchMonitorRelayServer
 from src.devices import Devices
 from src.log_message import LogMessage, LogMessageSystems, LogMessageTypes
+from src.log_messages_model import LogMessagesModel, LogTableCols
 from src.putting_settings import PuttingSettings
 from src.settings import Settings, LaunchMonitor
 from src.PuttingForm import PuttingForm
@@ -35,44 +37,138 @@ from src.gspro_connection import GSProConnection
 from src.device_launch_monitor_screenshot import DeviceLaunchMonitorScreenshot
 from src.putting import Putting
 from src.shot_analytics_widget import ShotAnalyticsWidget
+from src.worker_thread import WorkerThread
+from src.shot_history_model import ShotHistoryModel, format_metric_display
+
+# Snapshot of the shot metrics so the per shot loops don't re-walk the properties dict
+PROPERTY_ITEMS = tuple(BallData.properties.items())
+# Shot history column of each metric, column 0 holds the shot result
+PROPERTY_COLUMNS = {metric: column for column, (metric, _) in enumerate(PROPERTY_ITEMS, start=1)}
+
+# Sample ranges for the generated test shot, drawn in a single call:
+# speed, total spin, vla, spin axis, hla, club speed, back spin ratio,
+# speed at impact ratio, face to target, face to path
+_RNG = np.random.default_rng()
+_TEST_METRICS_LOW = np.array([150, 2200, 12, -8, -4, 90, 0.6, 0.93, -2, -3], dtype=float)
+_TEST_METRICS_HIGH = np.array([185, 3600, 18, 8, 4, 110, 0.85, 0.99, 2, 3], dtype=float)
+
+# Metrics used to decide if a delayed club metrics update belongs to the last sent shot
+SHOT_KEY_METRICS = (
+    BallMetrics.SPEED,
+    BallMetrics.TOTAL_SPIN,
+    BallMetrics.HLA,
+    BallMetrics.VLA,
+    BallMetrics.CLUB_SPEED,
+    BallMetrics.BACK_SPIN,
+    BallMetrics.SIDE_SPIN,
+)
+# Metrics shown in the log window when a shot is sent, the full shot goes to the log file
+_SUCCESS_SUMMARY_METRICS = (
+    BallMetrics.SPEED,
+    BallMetrics.TOTAL_SPIN,
+    BallMetrics.SPIN_AXIS,
+    BallMetrics.HLA,
+    BallMetrics.VLA,
+    BallMetrics.CLUB_SPEED,
+)
+# A delayed club metric holding one of these has not been read yet
+_UNSET_METRIC_VALUES = (None, '', BallData.invalid_value)
+
+
+class _AnyValue:
+    """Placeholder for a missing metric, compares equal to any value."""
+
+    def __eq__(self, other):
+        return True
+
+    def __ne__(self, other):
+        return False
 
+    __hash__ = object.__hash__
 
-@dataclass
-class LogTableCols:
-    date = 0
-    system = 1
-    message = 2
+
+_ANY_VALUE = _AnyValue()
+
+
+def _log_training_files(path: str) -> None:
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".traineddata"):
+                stat = entry.stat()
+                dt = datetime.fromtimestamp(stat.st_ctime)
+                logging.debug(f"Training file name: {entry.name} Date: {dt} Size: {stat.st_size}")
+
+
+def _shot_key(balldata: BallData) -> tuple:
+    key = []
+    for metric in SHOT_KEY_METRICS:
+        value = getattr(balldata, metric, None)
+        if value is None or value == '' or value == BallData.invalid_value:
+            key.append(_ANY_VALUE)
+        elif isinstance(value, float):
+            key.append(round(value, 2))
+        else:
+            key.append(value)
+    return tuple(key)
 
 
 class MainWindow(QMainWindow, Ui_MainWindow):
     test_shot_generated = Signal(object)
     delayed_metrics_ready = Signal(object)
+    # Shot threshold, OBS threshold
+    thresholdsChanged = Signal(float, float)
     version = 'V1.04.20'
     app_name = 'MLM2PRO-GSPro-Connector'
-    good_shot_color = '#62ff00'
-    good_putt_color = '#fbff00'
-    bad_shot_color = '#ff3800'
-    corrected_value_color = '#ffa500'
+    good_shot_color = ShotHistoryModel.good_shot_color
+    good_putt_color = ShotHistoryModel.good_putt_color
+    bad_shot_color = ShotHistoryModel.bad_shot_color
+    corrected_value_color = ShotHistoryModel.corrected_value_color
+    vla_column = PROPERTY_COLUMNS[BallMetrics.VLA]
+    table_row_height = 22
+    log_file_max_bytes = 10 * 1024 * 1024
+    log_file_backup_count = 10
+    hla_column = PROPERTY_COLUMNS[BallMetrics.HLA]
 
     def __init__(self, app):
         super().__init__()
         self.setupUi(self)
+        # Optional widgets depend on how recently MainWindow_ui.py was regenerated
+        self._has_analytics_tab = hasattr(self, 'analytics_tab')
+        self._has_connector_tab = hasattr(self, 'connector_tab')
+        self._has_test_button = getattr(self, 'test_metrics_button', None) is not None
         self.launch_monitor = None
         self.edit_fields = {}
+        self._saturation_shown = None
+        self._log_time_second = None
+        self._log_time_text = ''
+        self.log_model = LogMessagesModel(self)
+        self.shot_history_model = ShotHistoryModel(self)
         self.app = app
         self.app_paths = AppDataPaths('mlm2pro-gspro-connect')
         self.app_paths.setup()
-        self.__setup_logging()
+        self._log_listener = None
+        self._log_file_handler = None
+        self._log_queue_handler = None
+        # Set once closeEvent starts, shots still queued to the GUI thread are then logged inline
+        self._closing = False
+        # Serialises shots for the log off the GUI thread, a single worker keeps them in order
+        self._log_executor = ThreadPoolExecutor(max_workers=1)
+        self._scan_thread = None
+        self._scan_worker = None
         self.settings = Settings(self.app_paths)
+        self.__setup_logging(self.settings)
         self.gspro_connection = GSProConnection(self)
-        self.settings_form = SettingsForm(settings=self.settings, app_paths=self.app_paths)
+        # The settings form and the analytics widget are only built the first time they are needed
+        self._settings_form = None
         self.putting_settings = PuttingSettings(self.app_paths)
         self.putting_settings_form = PuttingForm(main_window=self)
         self.putting = Putting(main_window=self)
         self.analytics_widget = None
+        self._pending_analytics = []
         self._test_metrics_data = None
         self._test_metrics_token = 0
         self._last_sent_shot = None
+        self._last_sent_shot_key = None
         self.setWindowTitle(f"{MainWindow.app_name} {MainWindow.version}")
 
         # Initialize slider default values
@@ -80,35 +176,90 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.current_obs_threshold = 16  # Default for OBS websocket trigger
         self.currentSaturationLabel.setText("Current Saturation: 0.00")
 
+        # Only refresh the threshold labels once a slider drag settles
+        self._saturation_timer = QTimer(self)
+        self._saturation_timer.setSingleShot(True)
+        self._saturation_timer.setInterval(40)
+        self._saturation_timer.timeout.connect(self.__flush_saturation_threshold)
+        self._obs_timer = QTimer(self)
+        self._obs_timer.setSingleShot(True)
+        self._obs_timer.setInterval(40)
+        self._obs_timer.timeout.connect(self.__flush_obs_threshold)
+        # The worker can report saturation faster than anyone can read it, show at most ~10 updates a second
+        self._saturation_pending = None
+        self._saturation_display_timer = QTimer(self)
+        self._saturation_display_timer.setSingleShot(True)
+        self._saturation_display_timer.setInterval(100)
+        self._saturation_display_timer.timeout.connect(self.__flush_saturation_display)
+        # The screenshot launch monitor only stores its latest saturation, read it at ~15 Hz
+        # while that device is selected, the relay server still goes through update_saturation_display
+        self._saturation_poll_timer = QTimer(self)
+        self._saturation_poll_timer.setInterval(66)
+        self._saturation_poll_timer.timeout.connect(self.__poll_saturation)
+        self._select_last_shot_timer = QTimer(self)
+        self._select_last_shot_timer.setSingleShot(True)
+        self._select_last_shot_timer.setInterval(0)
+        self._select_last_shot_timer.timeout.connect(self.__select_last_shot)
+        self._analytics_shot = None
+        self._analytics_timer = QTimer(self)
+        self._analytics_timer.setSingleShot(True)
+        self._analytics_timer.setInterval(100)
+        self._analytics_timer.timeout.connect(self.__flush_analytics)
+
         self.__setup_ui()
         self.__setup_connections()
         self.__auto_start()
         self.test_shot_generated.connect(self.gspro_connection.send_shot_worker.run)
         self.delayed_metrics_ready.connect(self.gspro_connection.send_shot_worker.run)
 
-    def __setup_logging(self):
-        settings = Settings(self.app_paths)
+    def __setup_logging(self, settings: Settings):
         level = logging.DEBUG
         path = self.app_paths.get_log_file_path(name=None, create=True, history=settings.keep_log_history == 'Yes')
         if os.path.isfile(path):
             os.unlink(path)
-        logging.basicConfig(
-            format="%(asctime)s,%(msecs)-3d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s",
-            datefmt="%Y-%m-%d:%H:%M:%S",
-            level=level,
-            filename=path,
-            encoding='utf-8',
-            force=True
+        # Log records are queued and written to the file by a background listener thread
+        # so logging calls from the GUI and worker threads never block on disk I/O
+        file_handler = RotatingFileHandler(
+            path,
+            maxBytes=MainWindow.log_file_max_bytes,
+            backupCount=MainWindow.log_file_backup_count,
+            encoding='utf-8'
         )
+        file_handler.setFormatter(logging.Formatter(
+            fmt="%(asctime)s,%(msecs)-3d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s",
+            datefmt="%Y-%m-%d:%H:%M:%S"
+        ))
+        log_queue = queue.Queue(-1)
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+        self._log_file_handler = file_handler
+        self._log_queue_handler = QueueHandler(log_queue)
+        root.addHandler(self._log_queue_handler)
+        root.setLevel(level)
+        self._log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._log_listener.start()
         logging.getLogger(__name__)
         logging.getLogger("PIL.PngImagePlugin").setLevel(logging.CRITICAL + 1)
         logging.debug(f"App Version: {MainWindow.version}")
-        path = os.getcwd()
-        for file in os.listdir(path):
-            if file.endswith(".traineddata"):
-                dt = datetime.fromtimestamp(os.stat(file).st_ctime)
-                size = os.stat(file).st_size
-                logging.debug(f"Training file name: {file} Date: {dt} Size: {size}")
+        self.__scan_training_files()
+
+    def __scan_training_files(self):
+        # Listing the training files is only informational, keep it off the GUI thread
+        self._scan_thread = QThread()
+        self._scan_worker = WorkerThread(_log_training_files, os.getcwd())
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_worker.finished.connect(self._scan_thread.quit)
+        self._scan_thread.started.connect(self._scan_worker.run)
+        self._scan_thread.start()
+
+    @property
+    def settings_form(self) -> SettingsForm:
+        if self._settings_form is None:
+            self._settings_form = SettingsForm(settings=self.settings, app_paths=self.app_paths)
+            self._settings_form.saved.connect(self.__settings_saved)
+        return self._settings_form
 
     def showEvent(self, event: QShowEvent) -> None:
         super(QMainWindow, self).showEvent(event)
@@ -122,25 +273,26 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.actionDonate.triggered.connect(self.__donate)
         self.actionShop.triggered.connect(self.__shop)
         self.gspro_connect_button.clicked.connect(self.__gspro_connect)
-        if hasattr(self, 'test_metrics_button'):
+        if self._has_test_button:
             self.test_metrics_button.clicked.connect(self.__run_test_metrics)
         self.main_tab.setCurrentIndex(0)
-        self.log_table.setHorizontalHeaderLabels(['Date', 'Type', 'System', 'Message'])
+        self.log_table.setModel(self.log_model)
         self.log_table.setColumnWidth(LogTableCols.date, 120)
         self.log_table.setColumnWidth(LogTableCols.message, 1000)
-        self.log_table.resizeRowsToContents()
         self.log_table.setTextElideMode(Qt.ElideNone)
-        headings = ['Result']
-        vla = list(BallData.properties).index(BallMetrics.VLA) + 1
-        hla = list(BallData.properties).index(BallMetrics.HLA) + 1
-        for metric in BallData.properties:
-            headings.append(BallData.properties[metric])
-        self.shot_history_table.resizeRowsToContents()
+        self.shot_history_table.setModel(self.shot_history_model)
         self.shot_history_table.setTextElideMode(Qt.ElideNone)
-        self.shot_history_table.setColumnCount(len(BallData.properties) + 1)
-        self.shot_history_table.setHorizontalHeaderLabels(headings)
-        self.shot_history_table.setColumnWidth(vla, 150)
-        self.shot_history_table.setColumnWidth(hla, 150)
+        # Every cell paints its own background, alternating row colours would only be painted over
+        self.shot_history_table.setAlternatingRowColors(False)
+        # Fixed size rows and user sized columns, so growing tables never re-measure their contents
+        for table in (self.log_table, self.shot_history_table):
+            table.setSortingEnabled(False)
+            table.setWordWrap(False)
+            table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            table.verticalHeader().setDefaultSectionSize(MainWindow.table_row_height)
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.shot_history_table.setColumnWidth(MainWindow.vla_column, 150)
+        self.shot_history_table.setColumnWidth(MainWindow.hla_column, 150)
         font = QFont()
         font.setPointSize(9)
         font.setBold(True)
@@ -150,9 +302,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.pause_button.clicked.connect(self.__pause_connector)
         self.restart_button.setEnabled(False)
         self.pause_button.setEnabled(False)
-        self.settings_form.saved.connect(self.__settings_saved)
+        self.__setup_edit_palettes()
         self.__find_edit_fields()
-        self.__setup_analytics_tab()
+        if self._has_analytics_tab:
+            self._analytics_index = self.main_tab.indexOf(self.analytics_tab)
+            if self._analytics_index != -1:
+                self.main_tab.setTabText(self._analytics_index, 'Analytics')
+            self.main_tab.currentChanged.connect(self.__main_tab_changed)
 
         # --- Initialize the Sliders ---
         # Slider for saturation threshold (shot data)
@@ -169,11 +325,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.obsSlider.setValue(self.current_obs_threshold)
         self.obsValueLabel.setText(str(self.current_obs_threshold))
 
+    def __setup_edit_palettes(self):
+        # One shared palette per shot history brush, swapped onto the edit fields as needed.
+        # Every model cell holds one of these brush objects, so the palettes are keyed by identity
+        self._edit_palettes = {}
+        for brush in self.shot_history_model.background_brushes:
+            palette = QPalette()
+            palette.setBrush(QPalette.Base, brush)
+            self._edit_palettes[id(brush)] = palette
+        good_shot_brush = self.shot_history_model.background_brushes[0]
+        self._good_shot_palette = self._edit_palettes[id(good_shot_brush)]
+
     def __ensure_test_button(self):
         """Make sure the Test button exists even if the UI file was not regenerated."""
-        if hasattr(self, 'test_metrics_button') and self.test_metrics_button is not None:
-            return
-        if not hasattr(self, 'connector_tab'):
+        if self._has_test_button or not self._has_connector_tab:
             return
         button = QPushButton(self.connector_tab)
         button.setObjectName('test_metrics_button')
@@ -183,6 +348,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         button.setMaximumHeight(40)
         button.setMinimumWidth(90)
         self.test_metrics_button = button
+        self._has_test_button = True
 
         layout = getattr(self, 'test_controls_layout', None)
         if layout is None:
@@ -208,18 +374,21 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # Connect slider value changes to their respective update functions
         self.saturationSlider.valueChanged.connect(self.update_saturation_threshold)
         self.obsSlider.valueChanged.connect(self.update_obs_threshold)
-        worker = getattr(self.launch_monitor, 'device_worker', None)
-        if worker is not None and hasattr(worker, 'saturationChanged'):
-            worker.saturationChanged.connect(self.update_saturation_display)
+
+    def __main_tab_changed(self, index: int):
+        if self.analytics_widget is None and index == self._analytics_index:
+            self.__setup_analytics_tab()
 
     def __setup_analytics_tab(self):
-        if not hasattr(self, 'analytics_tab'):
+        if not self._has_analytics_tab:
             return
         if self.analytics_widget is None:
             self.analytics_widget = ShotAnalyticsWidget(self)
-        layout = getattr(self, 'analytics_layout', None)
-        if layout is None:
-            layout = self.analytics_tab.layout()
+            # Catch up on the shots that arrived before the tab was first opened
+            for balldata, partial_update in self._pending_analytics:
+                self.analytics_widget.update_metrics(balldata, partial_update)
+            self._pending_analytics = []
+        layout = self.analytics_tab.layout()
         if layout is None:
             layout = QVBoxLayout(self.analytics_tab)
             layout.setContentsMargins(0, 0, 0, 0)
@@ -230,42 +399,63 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 if widget is not None:
                     widget.setParent(None)
         layout.addWidget(self.analytics_widget)
-        if hasattr(self.main_tab, 'indexOf'):
-            index = self.main_tab.indexOf(self.analytics_tab)
-            if index != -1:
-                self.main_tab.setTabText(index, 'Analytics')
 
     def update_saturation_display(self, saturation):
         """Slot to update the saturation display label."""
+        self._saturation_pending = saturation
+        if not self._saturation_display_timer.isActive():
+            self._saturation_display_timer.start()
+
+    def __poll_saturation(self):
+        saturation = self.launch_monitor.latest_saturation()
+        if saturation is None or saturation == self._saturation_shown:
+            return
+        self._saturation_shown = saturation
         self.currentSaturationLabel.setText(f"Current Saturation: {saturation:.2f}")
+
+    def __flush_saturation_display(self):
+        if self._saturation_pending is None:
+            return
+        self.currentSaturationLabel.setText(f"Current Saturation: {self._saturation_pending:.2f}")
+        self._saturation_pending = None
+
     def update_saturation_threshold(self, value):
         # Scale back to a float value (e.g., 25 becomes 2.5)
         self.current_saturation_threshold = value / 10.0
+        self._saturation_timer.start()
+
+    def __flush_saturation_threshold(self):
         self.saturationValueLabel.setText(f"{self.current_saturation_threshold:.1f}")
         logging.debug(f"Saturation threshold updated: {self.current_saturation_threshold}")
+        self.thresholdsChanged.emit(self.current_saturation_threshold, self.current_obs_threshold)
 
     def update_obs_threshold(self, value):
         # Scale back to a float value (e.g., 160 becomes 16.0)
         self.current_obs_threshold = value / 10.0
+        self._obs_timer.start()
+
+    def __flush_obs_threshold(self):
         self.obsValueLabel.setText(f"{self.current_obs_threshold:.1f}")
         logging.debug(f"OBS threshold updated: {self.current_obs_threshold}")
+        self.thresholdsChanged.emit(self.current_saturation_threshold, self.current_obs_threshold)
 
     def __run_test_metrics(self):
         """Populate the UI with sample metrics and send a delayed club update."""
         balldata = BallData()
         balldata.good_shot = True
         balldata.club = self.gspro_connection.current_club or 'TEST'
-        balldata.speed = round(random.uniform(150, 185), 1)
-        balldata.total_spin = int(random.uniform(2200, 3600))
-        balldata.vla = round(random.uniform(12, 18), 1)
-        balldata.spin_axis = round(random.uniform(-8, 8), 1)
-        balldata.hla = round(random.uniform(-4, 4), 1)
-        balldata.club_speed = round(random.uniform(90, 110), 1)
-        balldata.back_spin = int(balldata.total_spin * random.uniform(0.6, 0.85))
-        balldata.side_spin = int((balldata.total_spin - balldata.back_spin) * random.choice([-1, 1]))
-        balldata.face_to_target = round(random.uniform(-2, 2), 1)
-        balldata.face_to_path = round(random.uniform(-3, 3), 1)
-        balldata.speed_at_impact = round(balldata.speed * random.uniform(0.93, 0.99), 1)
+        values = _RNG.uniform(_TEST_METRICS_LOW, _TEST_METRICS_HIGH).tolist()
+        balldata.speed = round(values[0], 1)
+        balldata.total_spin = int(values[1])
+        balldata.vla = round(values[2], 1)
+        balldata.spin_axis = round(values[3], 1)
+        balldata.hla = round(values[4], 1)
+        balldata.club_speed = round(values[5], 1)
+        balldata.back_spin = int(balldata.total_spin * values[6])
+        balldata.side_spin = int((balldata.total_spin - balldata.back_spin) * (1 if _RNG.random() < 0.5 else -1))
+        balldata.face_to_target = round(values[8], 1)
+        balldata.face_to_path = round(values[9], 1)
+        balldata.speed_at_impact = round(balldata.speed * values[7], 1)
         balldata.path = BallData.invalid_value
         balldata.angle_of_attack = BallData.invalid_value
         self._test_metrics_data = balldata
@@ -279,8 +469,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     def __apply_delayed_test_metrics(self, token: int):
         if self._test_metrics_data is None or token != self._test_metrics_token:
             return
-        self._test_metrics_data.angle_of_attack = round(random.uniform(-6, 6), 1)
-        self._test_metrics_data.path = round(random.uniform(-5, 5), 1)
+        angle_of_attack, path = _RNG.uniform((-6, -5), (6, 5)).tolist()
+        self._test_metrics_data.angle_of_attack = round(angle_of_attack, 1)
+        self._test_metrics_data.path = round(path, 1)
         self.__display_metrics_in_fields(self._test_metrics_data)
         self.analytics_partial_update(self._test_metrics_data, partial_update=True)
         self.__refresh_last_shot_history_row(self._test_metrics_data)
@@ -294,30 +485,16 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 'Cannot send test shot because GSPro is not connected.'
             )
             return
-        if hasattr(self, 'test_shot_generated'):
-            self.test_shot_generated.emit(balldata)
-        else:
-            self.gspro_connection.send_shot_worker.run(balldata)
+        self.test_shot_generated.emit(balldata)
 
     def __display_metrics_in_fields(self, balldata: BallData):
         for metric, edit in self.edit_fields.items():
             if not hasattr(balldata, metric):
                 continue
             value = getattr(balldata, metric)
-            edit.setPlainText(self.__format_metric_display(value))
+            edit.setPlainText(format_metric_display(value))
             edit.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-            palette = edit.palette()
-            palette.setColor(QPalette.Base, QColor(MainWindow.good_shot_color))
-            edit.setPalette(palette)
-
-    def __format_metric_display(self, value):
-        if value is None or value == '' or value == BallData.invalid_value:
-            return ''
-        if isinstance(value, float):
-            if value.is_integer():
-                return str(int(value))
-            return f"{value:.2f}".rstrip('0').rstrip('.')
-        return str(value)
+            edit.setPalette(self._good_shot_palette)
 
     def __auto_start(self):
         if self.settings.auto_start_all_apps == 'Yes':
@@ -349,7 +526,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.__setup_launch_monitor()
 
     def __setup_launch_monitor(self):
-        if self.settings_form.prev_device_id != self.settings.device_id:
+        # Until the settings form has been opened there is no previous device to compare with
+        prev_device_id = None if self._settings_form is None else self._settings_form.prev_device_id
+        if prev_device_id != self.settings.device_id:
             if self.launch_monitor is not None:
                 self.launch_monitor.shutdown()
             if self.settings.device_id not in (
@@ -370,6 +549,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                     self.launch_monitor = DeviceLaunchMonitorBluetoothR10(self)
                 self.actionDevices.setEnabled(False)
             self.launch_monitor_groupbox.setTitle(f"{self.settings.device_id} Launch Monitor")
+            self._saturation_shown = None
+            if isinstance(self.launch_monitor, DeviceLaunchMonitorScreenshot):
+                self._saturation_poll_timer.start()
+            else:
+                self._saturation_poll_timer.stop()
 
     def __restart_connector(self):
         self.launch_monitor.resume()
@@ -383,11 +567,16 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         )
         if is_delayed_update:
             self.__refresh_last_shot_history_row(balldata, partial_update=True)
-            self._last_sent_shot = balldata.__copy__()
+            # Delayed updates are the payload copies made in __maybe_send_delayed_club_metrics,
+            # nothing else holds them so they can be kept without another copy
+            self._last_sent_shot = balldata
+            self._last_sent_shot_key = _shot_key(self._last_sent_shot)
             return
         self.__add_shot_history_row(balldata)
         self.__update_analytics(balldata, partial_update=False)
+        # New shots can still be changed by their sender (e.g. the delayed test metrics)
         self._last_sent_shot = balldata.__copy__()
+        self._last_sent_shot_key = _shot_key(self._last_sent_shot)
 
     def __pause_connector(self):
         self.launch_monitor.pause()
@@ -396,12 +585,26 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.close()
 
     def closeEvent(self, event: QShowEvent) -> None:
+        self._closing = True
         logging.debug(f'{MainWindow.app_name} Closing gspro connection')
         self.gspro_connection.shutdown()
         logging.debug(f'{MainWindow.app_name} Closing putting')
         self.putting.shutdown()
         logging.debug(f'{MainWindow.app_name} Closing launch monitor connection')
         self.launch_monitor.shutdown()
+        if self._scan_thread is not None:
+            self._scan_thread.quit()
+            self._scan_thread.wait()
+            self._scan_thread = None
+        logging.debug(f'{MainWindow.app_name} Closing log')
+        self._log_executor.shutdown(wait=True)
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+            # Anything logged after this point is written straight to the file rather than left in the queue
+            root = logging.getLogger()
+            root.removeHandler(self._log_queue_handler)
+            root.addHandler(self._log_file_handler)
 
     def __settings(self):
         self.settings_form.show()
@@ -434,55 +637,24 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def __add_log_row(self, message: LogMessage):
         if message.display_on(LogMessageTypes.LOG_WINDOW):
-            row = self.log_table.rowCount()
-            self.log_table.insertRow(row)
-            item = QTableWidgetItem(datetime.now().strftime("%Y/%m/%d %H:%M:%S"))
-            item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-            self.log_table.setItem(row, LogTableCols.date, item)
-            item = QTableWidgetItem(message.message_system)
-            item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-            self.log_table.setItem(row, LogTableCols.system, item)
-            item = QTableWidgetItem(message.message)
-            item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-            self.log_table.setItem(row, LogTableCols.message, item)
-            self.log_table.selectRow(self.log_table.rowCount() - 1)
+            # Follow the newest row by scrolling, selecting it would rebuild the selection on every message
+            self.log_model.append(self.__log_time(), message)
+            self.log_table.scrollToBottom()
         if message.display_on(LogMessageTypes.LOG_FILE):
             logging.log(logging.INFO, message.message_string())
         if message.display_on(LogMessageTypes.STATUS_BAR):
             self.statusbar.showMessage(message.message, 2000)
 
+    def __log_time(self) -> str:
+        # Bursts of log rows share the same second so only format it once
+        now = int(time.time())
+        if now != self._log_time_second:
+            self._log_time_second = now
+            self._log_time_text = time.strftime("%Y/%m/%d %H:%M:%S", time.localtime(now))
+        return self._log_time_text
+
     def __add_shot_history_row(self, balldata: BallData):
-        row = self.shot_history_table.rowCount()
-        self.shot_history_table.insertRow(row)
-        i = 1
-        for metric in BallData.properties:
-            error = False
-            correction = False
-            if len(balldata.errors) > 0 and metric in balldata.errors and len(balldata.errors[metric]):
-                error = True
-                value = 'Error'
-            elif len(balldata.corrections) > 0 and metric in balldata.corrections and len(balldata.corrections[metric]):
-                correction = True
-                value = self.__format_metric_display(getattr(balldata, metric))
-            else:
-                value = self.__format_metric_display(getattr(balldata, metric))
-            item = QTableWidgetItem(value)
-            item.setTextAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-            item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-            self.shot_history_table.setItem(row, i, item)
-            if error:
-                item.setBackground(QColor(MainWindow.bad_shot_color))
-            elif correction:
-                item.setBackground(QColor(MainWindow.corrected_value_color))
-            else:
-                if balldata.putt_type is None:
-                    item.setBackground(QColor(MainWindow.good_shot_color))
-                else:
-                    item.setBackground(QColor(MainWindow.good_putt_color))
-            i += 1
-        result = 'Success'
         if not balldata.good_shot:
-            result = 'Failure'
             for metric in balldata.errors:
                 self.log_message(
                     LogMessageTypes.LOGS,
@@ -490,27 +662,64 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                     f"{BallData.properties[metric]}: {balldata.errors[metric]}"
                 )
         else:
+            summary = ', '.join(
+                f"{BallData.properties[metric]}: {format_metric_display(getattr(balldata, metric, None))}"
+                for metric in _SUCCESS_SUMMARY_METRICS
+            )
             self.log_message(
                 LogMessageTypes.LOGS,
                 LogMessageSystems.GSPRO_CONNECT,
-                f"{result}: {balldata.to_json()}"
+                f"Success: {summary}"
             )
-        item = QTableWidgetItem(result)
-        item.setTextAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-        item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-        self.shot_history_table.setItem(row, 0, item)
-        if not balldata.good_shot:
-            item.setBackground(QColor(MainWindow.bad_shot_color))
-        else:
-            if balldata.putt_type is None:
-                item.setBackground(QColor(MainWindow.good_shot_color))
+            if self._closing:
+                # The executor may already be shut down
+                self.__log_shot_json(balldata)
             else:
-                item.setBackground(QColor(MainWindow.good_putt_color))
-        self.shot_history_table.selectRow(self.shot_history_table.rowCount() - 1)
+                # The sender may still change the shot, so serialise a copy
+                self._log_executor.submit(self.__log_shot_json, balldata.__copy__())
+        # Keep the insert from firing __shot_history_changed, the fields are updated once the last row is selected
+        with QSignalBlocker(self.shot_history_table.selectionModel()):
+            self.shot_history_model.append(balldata)
+        # Shots arriving in the same event loop pass share one selection change
+        self._select_last_shot_timer.start()
+
+    def __log_shot_json(self, balldata: BallData):
+        # Normally runs on the log executor, which drops exceptions, so log them here
+        try:
+            logging.info(f"Shot sent: {balldata.to_json()}")
+        except Exception:
+            logging.exception("Could not serialise shot for the log")
+
+    def __select_last_shot(self):
+        self.shot_history_table.selectRow(self.shot_history_model.rowCount() - 1)
 
     def __update_analytics(self, balldata, partial_update: bool):
-        if self.analytics_widget is not None and balldata is not None:
+        if balldata is None:
+            return
+        if not partial_update:
+            # Shots arriving in a burst only redraw the analytics once for the latest of them
+            self._analytics_shot = balldata
+            self._analytics_timer.start()
+            return
+        # A partial update belongs to the pending shot, so that has to be shown first
+        self.__flush_analytics()
+        self.__apply_analytics(balldata, partial_update)
+
+    def __flush_analytics(self):
+        self._analytics_timer.stop()
+        if self._analytics_shot is not None:
+            balldata = self._analytics_shot
+            self._analytics_shot = None
+            self.__apply_analytics(balldata, partial_update=False)
+
+    def __apply_analytics(self, balldata, partial_update: bool):
+        if self.analytics_widget is not None:
             self.analytics_widget.update_metrics(balldata, partial_update)
+        elif self._has_analytics_tab:
+            # Only the latest shot and its partial updates matter once the widget is built
+            if not partial_update:
+                self._pending_analytics = []
+            self._pending_analytics.append((balldata, partial_update))
 
     def analytics_partial_update(self, balldata, partial_update: bool):
         if partial_update:
@@ -528,16 +737,18 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             or self._last_sent_shot is None
         ):
             return
-        if not self.__is_same_shot(balldata, self._last_sent_shot):
+        if not self.__is_same_shot(balldata):
             return
+        # Club path and angle of attack are the only delayed metrics, read them directly
+        last_shot = self._last_sent_shot
         updated = False
-        for metric in (BallMetrics.CLUB_PATH, BallMetrics.ANGLE_OF_ATTACK):
-            value = getattr(balldata, metric, BallData.invalid_value)
-            if value in (None, '', BallData.invalid_value):
-                continue
-            if getattr(self._last_sent_shot, metric, BallData.invalid_value) == value:
-                continue
-            setattr(self._last_sent_shot, metric, value)
+        path = balldata.path
+        if path not in _UNSET_METRIC_VALUES and last_shot.path != path:
+            last_shot.path = path
+            updated = True
+        angle_of_attack = balldata.angle_of_attack
+        if angle_of_attack not in _UNSET_METRIC_VALUES and last_shot.angle_of_attack != angle_of_attack:
+            last_shot.angle_of_attack = angle_of_attack
             updated = True
         if not updated:
             return
@@ -545,54 +756,15 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         payload.include_ball_data = False
         payload.include_club_data = True
         payload.reuse_last_shot_number = True
-        if hasattr(self, 'delayed_metrics_ready'):
-            self.delayed_metrics_ready.emit(payload)
-        else:
-            self.gspro_connection.send_shot_worker.run(payload)
-
-    def __is_same_shot(self, candidate: BallData, reference: BallData) -> bool:
-        key_metrics = (
-            BallMetrics.SPEED,
-            BallMetrics.TOTAL_SPIN,
-            BallMetrics.HLA,
-            BallMetrics.VLA,
-            BallMetrics.CLUB_SPEED,
-            BallMetrics.BACK_SPIN,
-            BallMetrics.SIDE_SPIN,
-        )
-        for metric in key_metrics:
-            candidate_value = getattr(candidate, metric, None)
-            reference_value = getattr(reference, metric, None)
-            if candidate_value in (None, '', BallData.invalid_value) or reference_value in (None, '', BallData.invalid_value):
-                continue
-            try:
-                if isinstance(candidate_value, float) or isinstance(reference_value, float):
-                    if abs(float(candidate_value) - float(reference_value)) > 0.01:
-                        return False
-                else:
-                    if candidate_value != reference_value:
-                        return False
-            except TypeError:
-                if candidate_value != reference_value:
-                    return False
-        return True
+        self.delayed_metrics_ready.emit(payload)
+
+    def __is_same_shot(self, candidate: BallData) -> bool:
+        return _shot_key(candidate) == self._last_sent_shot_key
 
     def __refresh_last_shot_history_row(self, balldata: BallData, partial_update: bool = False) -> None:
-        if self.shot_history_table.rowCount() == 0 or balldata is None:
+        if self.shot_history_model.rowCount() == 0 or balldata is None:
             return
-        row = self.shot_history_table.rowCount() - 1
-        column = 1
-        for metric in BallData.properties:
-            if hasattr(balldata, metric):
-                value = getattr(balldata, metric)
-                if value not in (None, '', BallData.invalid_value):
-                    item = self.shot_history_table.item(row, column)
-                    if item is None:
-                        item = QTableWidgetItem()
-                        item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-                        self.shot_history_table.setItem(row, column, item)
-                    item.setText(self.__format_metric_display(value))
-            column += 1
+        self.shot_history_model.refresh_last_row(balldata)
 
         if partial_update:
             self.__update_analytics(balldata, partial_update)
@@ -606,15 +778,22 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                     if isinstance(edit, QTextEdit):
                         self.edit_fields[edit.objectName().replace('_edit', '')] = edit
                         edit.setReadOnly(True)
+        # Shot history column and edit field for each metric shown when a row is selected
+        self._visible_edit_pairs = [
+            (column, self.edit_fields[metric])
+            for column, (metric, _) in enumerate(PROPERTY_ITEMS, start=1)
+            if metric in self.edit_fields and metric not in (BallMetrics.CLUB, BallMetrics.CLUB_FACE_TO_PATH)
+        ]
 
     def __shot_history_changed(self):
-        i = 1
-        for metric in BallData.properties:
-            item = self.shot_history_table.item(self.shot_history_table.currentRow(), i)
-            if metric != BallMetrics.CLUB and metric != BallMetrics.CLUB_FACE_TO_PATH:
-                self.edit_fields[metric].setPlainText(item.text())
-                self.edit_fields[metric].setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-                palette = self.edit_fields[metric].palette()
-                palette.setColor(QPalette.Base, item.background().color())
-                self.edit_fields[metric].setPalette(palette)
-            i += 1
+        row = self.shot_history_table.currentIndex().row()
+        if row < 0:
+            # Selection was cleared, leave the fields showing the last shot
+            return
+        # Read the row straight from the model rather than through an index and role per cell
+        texts = self.shot_history_model.row_texts(row)
+        brushes = self.shot_history_model.row_brushes(row)
+        for column, edit in self._visible_edit_pairs:
+            edit.setPlainText(texts[column])
+            edit.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
+            edit.setPalette(self._edit_palettes[id(brushes[column])])
@@ -51,6 +51,10 @@ class DeviceBase(QObject):
     def reload_putting_rois(self):
         pass
 
+    def latest_saturation(self):
+        # Devices that sample the screen saturation return their worker's last reading
+        return None
+
     def is_paused(self):
         return (self.device_worker is not None and self.device_worker.is_paused())
 
@@ -1,4 +1,5 @@
 import logging
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QMessageBox
 from src.DevicesForm import DevicesForm
 from src.SelectDeviceForm import SelectDeviceForm
@@ -31,8 +32,14 @@ class DeviceLaunchMonitorScreenshot(DeviceBase):
         self.device_worker.shot.connect(self.main_window.gspro_connection.send_shot_worker.run)
         self.device_worker.bad_shot.connect(self.__bad_shot)
         self.device_worker.too_many_ghost_shots.connect(self.__too_many_ghost_shots)
-        if hasattr(self.device_worker, 'metrics'):
-            self.device_worker.metrics.connect(self.main_window.analytics_partial_update)
+        self.device_worker.metrics.connect(self.main_window.analytics_partial_update)
+        # Direct, a queued call would wait on the worker's event loop which run() never returns to
+        self.main_window.thresholdsChanged.connect(self.device_worker.set_thresholds, Qt.DirectConnection)
+
+    def latest_saturation(self):
+        if self.device_worker is None:
+            return None
+        return self.device_worker.latest_saturation
 
     def __bad_shot(self, balldata):
         self.main_window.shot_sent(balldata)
@@ -0,0 +1,68 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from src.log_message import LogMessage
+
+
+@dataclass
+class LogTableCols:
+    date = 0
+    system = 1
+    message = 2
+
+
+class LogMessagesModel(QAbstractTableModel):
+    """Table model for the log window, holding the time stamp and message of each row."""
+
+    headings = ('Date', 'System', 'Message')
+    max_rows = 2000
+
+    # Every cell is read only, so the flags are the same for all of them
+    item_flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        # Ring buffer, the oldest messages are dropped once max_rows is reached
+        self._rows: Deque[Tuple[str, LogMessage]] = deque(maxlen=LogMessagesModel.max_rows)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(LogMessagesModel.headings)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return LogMessagesModel.headings[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return LogMessagesModel.item_flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        date, message = self._rows[index.row()]
+        column = index.column()
+        if column == LogTableCols.date:
+            return date
+        if column == LogTableCols.system:
+            return message.message_system
+        return message.message
+
+    def append(self, date: str, message: LogMessage) -> None:
+        if len(self._rows) >= LogMessagesModel.max_rows:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._rows.popleft()
+            self.endRemoveRows()
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append((date, message))
+        self.endInsertRows()
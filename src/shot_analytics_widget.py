@@ -1,5 +1,5 @@
 import math
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
@@ -14,58 +14,76 @@ from PySide6.QtWidgets import (
 
 from src.ball_data import BallData
 
+# Neutral, positive and negative wording for the metrics shown with a direction
+_DIRECTIONAL_LABELS: Dict[str, Tuple[str, str, str]] = {
+    "face_to_path": ("Square", "Open", "Closed"),
+    "face_to_target": ("Square", "Open", "Closed"),
+    "path": ("Zero", "InToOut", "OutToIn"),
+    "angle_of_attack": ("Level", "Up", "Down"),
+    "hla": ("Center", "Right", "Left"),
+    "spin_axis": ("Zero", "Right", "Left"),
+}
+
+_bold_fonts: Dict[int, QFont] = {}
+
+
+def _bold_font(point_size: int) -> QFont:
+    # Every label of a given size shares one font, built on first use once the application exists
+    font = _bold_fonts.get(point_size)
+    if font is None:
+        font = QFont()
+        font.setPointSize(point_size)
+        font.setBold(True)
+        _bold_fonts[point_size] = font
+    return font
+
 
 class MetricBlock(QFrame):
     """Simple panel used for the large headline metrics."""
 
+    base_style = (
+        "QFrame {"
+        "background-color: #11161c;"
+        "border: 1px solid #2f3842;"
+        "border-radius: 8px;"
+        "}"
+    )
+    highlight_style = (
+        "QFrame {"
+        "background-color: #1f2d36;"
+        "border: 1px solid #40c4ff;"
+        "border-radius: 8px;"
+        "}"
+    )
+
     def __init__(self, title: str, unit: str = "", decimals: int = 1) -> None:
         super().__init__()
         self.unit = unit
         self.decimals = decimals
-        self._base_style = (
-            "QFrame {"
-            "background-color: #11161c;"
-            "border: 1px solid #2f3842;"
-            "border-radius: 8px;"
-            "}"
-        )
-        self._highlight_style = (
-            "QFrame {"
-            "background-color: #1f2d36;"
-            "border: 1px solid #40c4ff;"
-            "border-radius: 8px;"
-            "}"
-        )
-        self.setStyleSheet(self._base_style)
+        self._format = f"{{:.{decimals}f}} {unit}" if unit else f"{{:.{decimals}f}}"
+        self._highlighted = False
+        self.setStyleSheet(MetricBlock.base_style)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 10, 12, 10)
         layout.setSpacing(4)
 
         title_label = QLabel(title.upper())
-        title_font = QFont()
-        title_font.setPointSize(10)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_bold_font(10))
         title_label.setStyleSheet("color: #9fb3c8; letter-spacing: 1px;")
         layout.addWidget(title_label, alignment=Qt.AlignLeft)
 
         self.value_label = QLabel("--")
-        value_font = QFont()
-        value_font.setPointSize(28)
-        value_font.setBold(True)
-        self.value_label.setFont(value_font)
+        self.value_label.setFont(_bold_font(28))
         self.value_label.setStyleSheet("color: #f7f9fb;")
         layout.addWidget(self.value_label, alignment=Qt.AlignLeft)
 
     def set_value(self, value: Optional[float], highlight: bool = False) -> None:
-        if value is None:
-            text = "--"
-        else:
-            text = f"{value:.{self.decimals}f}"
-            if self.unit:
-                text = f"{text} {self.unit}"
+        text = "--" if value is None else self._format.format(value)
         self.value_label.setText(text)
-        self.setStyleSheet(self._highlight_style if highlight else self._base_style)
+        # Applying a style sheet repolishes the whole block, so only do it when the state flips
+        if highlight != self._highlighted:
+            self._highlighted = highlight
+            self.setStyleSheet(MetricBlock.highlight_style if highlight else MetricBlock.base_style)
 
     def reset(self) -> None:
         self.set_value(None)
@@ -74,29 +92,26 @@ class MetricBlock(QFrame):
 class DetailSection(QFrame):
     """Displays label/value pairs for the more granular shot metrics."""
 
+    frame_style = (
+        "QFrame {"
+        "background-color: #0f151c;"
+        "border: 1px solid #2a323d;"
+        "border-radius: 8px;"
+        "}"
+    )
+    value_style = "color: #f0f4f8; font-size: 18px; font-weight: 600;"
+    highlight_style = "color: #7ae2ff; font-size: 18px; font-weight: 700;"
+
     def __init__(self, title: str, metrics: Dict[str, str]) -> None:
         super().__init__()
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet(
-            "QFrame {"
-            "background-color: #0f151c;"
-            "border: 1px solid #2a323d;"
-            "border-radius: 8px;"
-            "}"
-        )
-        self._value_style = "color: #f0f4f8; font-size: 18px; font-weight: 600;"
-        self._highlight_style = (
-            "color: #7ae2ff; font-size: 18px; font-weight: 700;"
-        )
+        self.setStyleSheet(DetailSection.frame_style)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
 
         header = QLabel(title)
-        header_font = QFont()
-        header_font.setPointSize(12)
-        header_font.setBold(True)
-        header.setFont(header_font)
+        header.setFont(_bold_font(12))
         header.setStyleSheet("color: #9fb3c8; letter-spacing: 0.5px;")
         layout.addWidget(header)
 
@@ -105,7 +120,9 @@ class DetailSection(QFrame):
         self.grid.setVerticalSpacing(6)
         layout.addLayout(self.grid)
 
+        self.metrics = tuple(metrics)
         self._value_labels: Dict[str, QLabel] = {}
+        self._highlighted: Dict[str, bool] = {}
         row = 0
         for metric_key, metric_name in metrics.items():
             label = QLabel(metric_name)
@@ -113,9 +130,10 @@ class DetailSection(QFrame):
             self.grid.addWidget(label, row, 0, alignment=Qt.AlignLeft)
 
             value_label = QLabel("--")
-            value_label.setStyleSheet(self._value_style)
+            value_label.setStyleSheet(DetailSection.value_style)
             self.grid.addWidget(value_label, row, 1, alignment=Qt.AlignRight)
             self._value_labels[metric_key] = value_label
+            self._highlighted[metric_key] = False
             row += 1
 
     def set_value(self, key: str, text: str, highlight: bool = False) -> None:
@@ -123,40 +141,45 @@ class DetailSection(QFrame):
             return
         label = self._value_labels[key]
         label.setText(text)
-        label.setStyleSheet(
-            self._highlight_style if highlight else self._value_style
-        )
+        if highlight != self._highlighted[key]:
+            self._highlighted[key] = highlight
+            label.setStyleSheet(
+                DetailSection.highlight_style if highlight else DetailSection.value_style
+            )
 
     def reset(self) -> None:
-        for label in self._value_labels.values():
-            label.setText("--")
-            label.setStyleSheet(self._value_style)
+        for key in self._value_labels:
+            self.set_value(key, "--")
 
 
 class ShotAnalyticsWidget(QWidget):
     """Graphical analytics panel for displaying ball/club metrics."""
 
+    # Order of the values returned by _prepare_values
+    _tracked_metrics = (
+        "speed",
+        "club_speed",
+        "efficiency",
+        "speed_at_impact",
+        "total_spin",
+        "face_to_path",
+        "face_to_target",
+        "path",
+        "angle_of_attack",
+        "hla",
+        "vla",
+        "spin_axis",
+        "back_spin",
+        "side_spin",
+    )
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        self._tracked_metrics = (
-            "speed",
-            "club_speed",
-            "efficiency",
-            "speed_at_impact",
-            "total_spin",
-            "face_to_path",
-            "face_to_target",
-            "path",
-            "angle_of_attack",
-            "hla",
-            "vla",
-            "spin_axis",
-            "back_spin",
-            "side_spin",
-        )
         self._last_values: Dict[str, Optional[float]] = {
             key: None for key in self._tracked_metrics
         }
+        self._highlighted_metrics = set()
+        self._status_partial: Optional[bool] = None
         self._build_ui()
         self.reset()
 
@@ -171,18 +194,12 @@ class ShotAnalyticsWidget(QWidget):
         header_row.setSpacing(12)
 
         self.status_label = QLabel("Waiting for shot data")
-        status_font = QFont()
-        status_font.setPointSize(12)
-        status_font.setBold(True)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(_bold_font(12))
         self.status_label.setStyleSheet("color: #9fb3c8;")
         header_row.addWidget(self.status_label, 1)
 
         self.club_label = QLabel("Club: --")
-        club_font = QFont()
-        club_font.setPointSize(12)
-        club_font.setBold(True)
-        self.club_label.setFont(club_font)
+        self.club_label.setFont(_bold_font(12))
         self.club_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         self.club_label.setStyleSheet(
             "color: #f7f9fb; background-color: #1b2530;"
@@ -237,6 +254,12 @@ class ShotAnalyticsWidget(QWidget):
         )
         details_row.addWidget(self.spin_section, 1)
 
+        # Detail section showing each of the non summary metrics
+        self._metric_sections: Dict[str, DetailSection] = {}
+        for section in (self.face_section, self.launch_section, self.spin_section):
+            for metric in section.metrics:
+                self._metric_sections[metric] = section
+
         layout.addLayout(details_row)
 
     def reset(self) -> None:
@@ -247,59 +270,75 @@ class ShotAnalyticsWidget(QWidget):
         self.spin_section.reset()
         self.status_label.setText("Waiting for shot data")
         self.status_label.setStyleSheet("color: #9fb3c8;")
+        self._status_partial = None
         self.club_label.setText("Club: --")
         for key in self._tracked_metrics:
             self._last_values[key] = None
+        self._highlighted_metrics.clear()
 
     def update_metrics(self, balldata: Optional[BallData], partial_update: bool = False) -> None:
         if balldata is None:
             self.reset()
             return
-
+        # Hold painting until every label has been updated so the shot is drawn in one pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._show_metrics(balldata, partial_update)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _show_metrics(self, balldata: BallData, partial_update: bool) -> None:
         self.club_label.setText(f"Club: {balldata.club or '--'}")
-        if partial_update:
-            self.status_label.setText("Partial metrics update received")
-            self.status_label.setStyleSheet("color: #f5c04a;")
-        else:
-            self.status_label.setText("Shot data updated")
-            self.status_label.setStyleSheet("color: #7fe36c;")
-
-        values = self._prepare_values(balldata)
-        for metric, value in values.items():
+        if partial_update != self._status_partial:
+            self._status_partial = partial_update
+            if partial_update:
+                self.status_label.setText("Partial metrics update received")
+                self.status_label.setStyleSheet("color: #f5c04a;")
+            else:
+                self.status_label.setText("Shot data updated")
+                self.status_label.setStyleSheet("color: #7fe36c;")
+
+        highlighted = self._highlighted_metrics
+        for metric, value in zip(ShotAnalyticsWidget._tracked_metrics, self._prepare_values(balldata)):
             changed = value != self._last_values.get(metric)
+            # Nothing to redraw when the value is the same and it is not losing its highlight
+            if not changed and metric not in highlighted:
+                continue
             highlight = partial_update and changed
-            if metric in self.summary_blocks:
-                self.summary_blocks[metric].set_value(value, highlight)
-            elif metric in ("face_to_path", "face_to_target", "path", "angle_of_attack"):
-                text = self._format_directional_text(metric, value)
-                self.face_section.set_value(metric, text, highlight)
-            elif metric in ("hla", "vla", "spin_axis"):
-                text = self._format_directional_text(metric, value)
-                self.launch_section.set_value(metric, text, highlight)
-            elif metric in ("back_spin", "side_spin"):
-                text = self._format_spin(value)
-                self.spin_section.set_value(metric, text, highlight)
+            if highlight:
+                highlighted.add(metric)
+            else:
+                highlighted.discard(metric)
+            block = self.summary_blocks.get(metric)
+            section = self._metric_sections.get(metric)
+            if block is not None:
+                block.set_value(value, highlight)
+            elif section is self.spin_section:
+                section.set_value(metric, self._format_spin(value), highlight)
+            elif section is not None:
+                section.set_value(metric, self._format_directional_text(metric, value), highlight)
             self._last_values[metric] = value
 
-    def _prepare_values(self, balldata: BallData) -> Dict[str, Optional[float]]:
-        values: Dict[str, Optional[float]] = {}
-        values["speed"] = self._valid_value(balldata.speed)
-        values["club_speed"] = self._valid_value(balldata.club_speed)
-        values["efficiency"] = self._calc_efficiency(
-            values["speed"], values["club_speed"]
+    def _prepare_values(self, balldata: BallData) -> Tuple[Optional[float], ...]:
+        valid_value = self._valid_value
+        speed = valid_value(balldata.speed)
+        club_speed = valid_value(balldata.club_speed)
+        return (
+            speed,
+            club_speed,
+            self._calc_efficiency(speed, club_speed),
+            valid_value(balldata.speed_at_impact),
+            valid_value(balldata.total_spin),
+            valid_value(balldata.face_to_path),
+            valid_value(balldata.face_to_target),
+            valid_value(balldata.path),
+            valid_value(balldata.angle_of_attack),
+            valid_value(balldata.hla),
+            valid_value(balldata.vla),
+            valid_value(balldata.spin_axis),
+            valid_value(balldata.back_spin),
+            valid_value(balldata.side_spin),
         )
-        values["speed_at_impact"] = self._valid_value(balldata.speed_at_impact)
-        values["total_spin"] = self._valid_value(balldata.total_spin)
-        values["face_to_path"] = self._valid_value(balldata.face_to_path)
-        values["face_to_target"] = self._valid_value(balldata.face_to_target)
-        values["path"] = self._valid_value(balldata.path)
-        values["angle_of_attack"] = self._valid_value(balldata.angle_of_attack)
-        values["hla"] = self._valid_value(balldata.hla)
-        values["vla"] = self._valid_value(balldata.vla)
-        values["spin_axis"] = self._valid_value(balldata.spin_axis)
-        values["back_spin"] = self._valid_value(balldata.back_spin)
-        values["side_spin"] = self._valid_value(balldata.side_spin)
-        return values
 
     def _valid_value(self, value: Optional[float]) -> Optional[float]:
         if value is None:
@@ -321,56 +360,18 @@ class ShotAnalyticsWidget(QWidget):
         if value is None:
             return "--"
         magnitude = abs(value)
-        if metric == "face_to_path":
+        labels = _DIRECTIONAL_LABELS.get(metric)
+        if labels is not None:
+            neutral, pos_label, neg_label = labels
             return self._format_directional_value(
                 magnitude,
                 value,
-                neutral="Square",
-                pos_label="Open",
-                neg_label="Closed",
-            )
-        if metric == "face_to_target":
-            return self._format_directional_value(
-                magnitude,
-                value,
-                neutral="Square",
-                pos_label="Open",
-                neg_label="Closed",
-            )
-        if metric == "path":
-            return self._format_directional_value(
-                magnitude,
-                value,
-                neutral="Zero",
-                pos_label="InToOut",
-                neg_label="OutToIn",
-            )
-        if metric == "angle_of_attack":
-            return self._format_directional_value(
-                magnitude,
-                value,
-                neutral="Level",
-                pos_label="Up",
-                neg_label="Down",
-            )
-        if metric == "hla":
-            return self._format_directional_value(
-                magnitude,
-                value,
-                neutral="Center",
-                pos_label="Right",
-                neg_label="Left",
+                neutral=neutral,
+                pos_label=pos_label,
+                neg_label=neg_label,
             )
         if metric == "vla":
             return f"{magnitude:.1f}°"
-        if metric == "spin_axis":
-            return self._format_directional_value(
-                magnitude,
-                value,
-                neutral="Zero",
-                pos_label="Right",
-                neg_label="Left",
-            )
         return f"{magnitude:.1f}"
 
     def _format_directional_value(
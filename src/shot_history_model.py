@@ -0,0 +1,141 @@
+from operator import attrgetter
+from typing import List, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor
+
+from src.ball_data import BallData
+
+
+def format_metric_display(value) -> str:
+    invalid_value = BallData.invalid_value
+    if value is None or value == '' or value == invalid_value:
+        return ''
+    if isinstance(value, float):
+        if value.is_integer():
+            return str(int(value))
+        # Trim the trailing zeros of the fixed 2 decimal text with a single slice
+        text = format(value, '.2f')
+        if text.endswith('00'):
+            return text[:-3]
+        if text[-1] == '0':
+            return text[:-1]
+        return text
+    return str(value)
+
+
+class ShotHistoryModel(QAbstractTableModel):
+    """Table model for the shot history, rows are stored as prebuilt cell text and brushes."""
+
+    result_column = 0
+    good_shot_color = '#62ff00'
+    good_putt_color = '#fbff00'
+    bad_shot_color = '#ff3800'
+    corrected_value_color = '#ffa500'
+    metrics = tuple(BallData.properties)
+    # Reads every metric of a shot in one call
+    metric_values = attrgetter(*metrics)
+    headings = ('Result',) + tuple(BallData.properties.values())
+
+    # Every cell is read only, so the flags are the same for all of them
+    item_flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        # Parallel lists, one entry per shot holding the value for every column
+        self._rows: List[List[str]] = []
+        self._row_brushes: List[Tuple[QBrush, ...]] = []
+        # Brushes are shared by every cell rather than parsed from the colour string per paint
+        self._good_shot_brush = QBrush(QColor(ShotHistoryModel.good_shot_color))
+        self._good_putt_brush = QBrush(QColor(ShotHistoryModel.good_putt_color))
+        self._bad_shot_brush = QBrush(QColor(ShotHistoryModel.bad_shot_color))
+        self._corrected_brush = QBrush(QColor(ShotHistoryModel.corrected_value_color))
+        self.background_brushes = (
+            self._good_shot_brush,
+            self._good_putt_brush,
+            self._bad_shot_brush,
+            self._corrected_brush
+        )
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(ShotHistoryModel.headings)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return ShotHistoryModel.headings[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return ShotHistoryModel.item_flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.BackgroundRole:
+            return self._row_brushes[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def row_texts(self, row: int) -> List[str]:
+        return self._rows[row]
+
+    def row_brushes(self, row: int) -> Tuple[QBrush, ...]:
+        return self._row_brushes[row]
+
+    def append(self, balldata: BallData) -> None:
+        if balldata.putt_type is None:
+            good_brush = self._good_shot_brush
+        else:
+            good_brush = self._good_putt_brush
+        texts = ['Success' if balldata.good_shot else 'Failure']
+        brushes = [good_brush if balldata.good_shot else self._bad_shot_brush]
+        errors = balldata.errors
+        corrections = balldata.corrections
+        for metric, value in zip(ShotHistoryModel.metrics, ShotHistoryModel.metric_values(balldata)):
+            if metric in errors and len(errors[metric]):
+                texts.append('Error')
+                brushes.append(self._bad_shot_brush)
+            elif metric in corrections and len(corrections[metric]):
+                texts.append(format_metric_display(value))
+                brushes.append(self._corrected_brush)
+            else:
+                texts.append(format_metric_display(value))
+                brushes.append(good_brush)
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(texts)
+        self._row_brushes.append(tuple(brushes))
+        self.endInsertRows()
+
+    def refresh_last_row(self, balldata: BallData) -> None:
+        """Overlay any valid metrics from balldata onto the most recent shot."""
+        if not self._rows:
+            return
+        texts = self._rows[-1]
+        first = last = None
+        for column, metric in enumerate(ShotHistoryModel.metrics, start=1):
+            value = getattr(balldata, metric, None)
+            if value in (None, '', BallData.invalid_value):
+                continue
+            text = format_metric_display(value)
+            if texts[column] == text:
+                continue
+            texts[column] = text
+            if first is None:
+                first = column
+            last = column
+        if first is None:
+            return
+        # One change notification spanning only the columns that were updated
+        row = len(self._rows) - 1
+        self.dataChanged.emit(self.index(row, first), self.index(row, last))
@@ -1,13 +1,11 @@
 import logging
+import selectors
 import socket
 import time
 import traceback
 import numpy as np
-import cv2
-from mss import mss
 from threading import Event
 from PySide6.QtCore import Signal
-from obswebsocket import obsws, requests  # Import OBS WebSocket library
 from src.gspro_connect import GSProConnect
 from src.settings import Settings
 from src.worker_base import WorkerBase
@@ -29,27 +27,39 @@ class WorkerDeviceLaunchMonitorRelayServer(WorkerBase):
         self.connection = None
         self._shutdown = Event()
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.settimeout(1)
+        # Readiness comes from the selector in run, so nothing waits on socket timeouts
+        self._socket.setblocking(False)
+        self._selector = None
 
         # Grayscale detection configuration
         self.capture_region = self.__load_capture_region()
         self.saturation_threshold = 13
-        self.required_consecutive_frames = 2
+        self.saturation_sample_stride = 4  # Only every 4th pixel in each direction is sampled
+        self.saturation_emit_step = 0.1  # Smallest saturation change worth sending to the UI
+        self._last_emitted_saturation = None
         self.check_interval = 0.5  # Time in seconds between checks
+        self.required_grayscale_s = 3.0  # How long grayscale or colour must hold before acting on it
+        self.required_consecutive_frames = max(1, round(self.required_grayscale_s / self.check_interval))
         self.wait_after_grayscale = 1.6  # Time to wait after detecting grayscale before resuming
 
         # OBS WebSocket configuration
         self.obs_host = "localhost"
         self.obs_port = 4455
         self.obs_password = "secret"
-        self.obs_ws = obsws(self.obs_host, self.obs_port, self.obs_password)
+        self.obs_ws = None
 
     def run(self) -> None:
+        # Screen capture and OBS are only needed once the relay server is started,
+        # importing them here keeps them out of the application's start up
+        from mss import mss
+        from obswebsocket import obsws, requests
         try:
             self.started.emit()
             self._pause.wait()
 
             # Connect to OBS WebSocket
+            self.obs_ws = obsws(self.obs_host, self.obs_port, self.obs_password)
+            replay_request = requests.TriggerHotkeyByName("ReplayBufferSave")
             obs_connected = False
             try:
                 self.obs_ws.connect()
@@ -68,101 +78,140 @@ class WorkerDeviceLaunchMonitorRelayServer(WorkerBase):
             consecutive_grayscale = 0
             consecutive_color = 0
 
+            # Listening until the connector connects, then connected until it goes away.
+            # The grayscale check only runs while listening, as it did when the connection was
+            # served by a blocking loop
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._socket, selectors.EVENT_READ)
+            next_check = time.monotonic()
+
             with mss() as sct:
                 capture_region = self.__resolve_capture_region(sct)
                 while not self._shutdown.is_set():
-                    #
-                    # (A) Grayscale detection logic
-                    #
-                    screenshot = sct.grab(capture_region)
-                    frame = np.array(screenshot)[:, :, :3]
-                    currently_grayscale = self.is_grayscale_image(frame)
-
-                    if currently_grayscale:
-                        consecutive_grayscale += 1
-                        consecutive_color = 0
+                    now = time.monotonic()
+                    if self.connection is not None:
+                        self._pause.wait()
+                        timeout = self.check_interval
+                    elif now < next_check:
+                        timeout = next_check - now
                     else:
-                        consecutive_color += 1
-                        consecutive_grayscale = 0
-
-                    stable_grayscale = (consecutive_grayscale >= self.required_consecutive_frames)
-                    stable_color = (consecutive_color >= self.required_consecutive_frames)
-
-                    if stable_grayscale and last_state != True:
-                        logging.debug(f'{self.name}: Detected stable grayscale region. Pausing processing.')
-                        self.pause()
-                        last_state = True
-
-                        logging.debug(f'{self.name}: Waiting {self.wait_after_grayscale} seconds before triggering OBS replay.')
-                        time.sleep(self.wait_after_grayscale)
-
-                        # Trigger OBS replay
-                        if obs_connected:
-                            try:
-                                logging.debug(f'{self.name}: Triggering OBS replay.')
-                                self.obs_ws.call(requests.TriggerHotkeyByName("ReplayBufferSave"))
-                            except Exception as e:
-                                logging.debug(f'{self.name}: Failed to trigger OBS replay: {e}')
+                        timeout = self.check_interval
+                        next_check = now + self.check_interval
+                        #
+                        # (A) Grayscale detection logic
+                        #
+                        screenshot = sct.grab(capture_region)
+                        # View the BGRA bytes mss already holds rather than copying them into a new array,
+                        # is_grayscale_image only samples the colour channels
+                        frame = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+                        currently_grayscale = self.is_grayscale_image(frame)
+
+                        if currently_grayscale:
+                            consecutive_grayscale += 1
+                            consecutive_color = 0
                         else:
-                            logging.debug(f'{self.name}: OBS WebSocket unavailable; skipping replay trigger.')
+                            consecutive_color += 1
+                            consecutive_grayscale = 0
 
-                        logging.debug(f'{self.name}: Resuming processing after grayscale detection.')
-                        self.resume()
+                        stable_grayscale = (consecutive_grayscale >= self.required_consecutive_frames)
+                        stable_color = (consecutive_color >= self.required_consecutive_frames)
 
-                    elif stable_color and last_state != False:
-                        logging.debug(f'{self.name}: Detected stable color region.')
-                        last_state = False
+                        if stable_grayscale and last_state != True:
+                            logging.debug(f'{self.name}: Detected stable grayscale region. Pausing processing.')
+                            self.pause()
+                            last_state = True
+
+                            logging.debug(f'{self.name}: Waiting {self.wait_after_grayscale} seconds before triggering OBS replay.')
+                            time.sleep(self.wait_after_grayscale)
+
+                            # Trigger OBS replay
+                            if obs_connected:
+                                try:
+                                    logging.debug(f'{self.name}: Triggering OBS replay.')
+                                    self.obs_ws.call(replay_request)
+                                except Exception as e:
+                                    logging.debug(f'{self.name}: Failed to trigger OBS replay: {e}')
+                            else:
+                                logging.debug(f'{self.name}: OBS WebSocket unavailable; skipping replay trigger.')
+
+                            logging.debug(f'{self.name}: Resuming processing after grayscale detection.')
+                            self.resume()
+
+                        elif stable_color and last_state != False:
+                            logging.debug(f'{self.name}: Detected stable color region.')
+                            last_state = False
 
                     #
                     # (B) Connection handling logic
                     #
-                    try:
-                        # Wait for connection
-                        self.connection, addr = self._socket.accept()
-                    except socket.timeout:
-                        pass
-                    else:
-                        msg = f"Connected to connector from: {addr[0]}:{addr[1]}"
-                        self.connected.emit()
-                        logging.debug(f'{self.name}: {msg}')
-                        while not self._shutdown.is_set():
-                            self._pause.wait()
-                            try:
-                                # Wait for data
-                                data = self.connection.recv(1024)
-                                if data:
-                                    logging.debug(f'{self.name}: Connector received data: {data.decode()}')
-                                    if self.gspro_connection.connected():
-                                        try:
-                                            msg = self.gspro_connection.send_msg(data)
-                                            self.send_msg(msg)
-                                            self.relay_server_shot.emit(data)
-                                            logging.debug(f'{self.name}: Connector sent data to GSPro result: {msg.decode()}')
-                                        except Exception as e:
-                                            logging.debug(
-                                                f'Error when trying to send shot to GSPro, process {self.name}: {format(e)}, {traceback.format_exc()}')
-                                            self.shot_error.emit((e, traceback.format_exc()))
-                                else:
-                                    self.disconnected.emit()
-                                    break
-                            except socket.timeout:
-                                pass
-                            except ConnectionError:
-                                logging.debug(f'{self.name}: Connector disconnected')
-                                break
-                            except Exception as e:
-                                raise e
-
-                    time.sleep(self.check_interval)
+                    # Sleep until the next grayscale check is due, waking straight away on a connection or data
+                    for key, _ in self._selector.select(max(0.0, timeout)):
+                        if key.fileobj is self._socket:
+                            self.__accept_connection()
+                        else:
+                            self.__receive_data()
 
         except Exception as e:
             logging.debug(f'Error in process {self.name}: {format(e)}, {traceback.format_exc()}')
             self.error.emit((e, traceback.format_exc()))
         finally:
+            self.__close_connection()
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
             if self._socket:
                 self._socket.close()
             self.finished.emit()
 
+    def __accept_connection(self):
+        try:
+            connection, addr = self._socket.accept()
+        except BlockingIOError:
+            # The connector gave up before we got to it
+            return
+        # Only one connector is served at a time, others wait in the backlog until it disconnects
+        self._selector.unregister(self._socket)
+        connection.setblocking(True)
+        self.connection = connection
+        self._selector.register(connection, selectors.EVENT_READ)
+        msg = f"Connected to connector from: {addr[0]}:{addr[1]}"
+        self.connected.emit()
+        logging.debug(f'{self.name}: {msg}')
+
+    def __receive_data(self):
+        try:
+            # The selector reported the connection readable so this returns without blocking
+            data = self.connection.recv(1024)
+        except ConnectionError:
+            logging.debug(f'{self.name}: Connector disconnected')
+            self.__close_connection()
+            return
+        if not data:
+            self.disconnected.emit()
+            self.__close_connection()
+            return
+        logging.debug(f'{self.name}: Connector received data: {data.decode()}')
+        if self.gspro_connection.connected():
+            try:
+                msg = self.gspro_connection.send_msg(data)
+                self.send_msg(msg)
+                self.relay_server_shot.emit(data)
+                logging.debug(f'{self.name}: Connector sent data to GSPro result: {msg.decode()}')
+            except Exception as e:
+                logging.debug(
+                    f'Error when trying to send shot to GSPro, process {self.name}: {format(e)}, {traceback.format_exc()}')
+                self.shot_error.emit((e, traceback.format_exc()))
+
+    def __close_connection(self):
+        # Back to listening for the next connector
+        if self.connection is None:
+            return
+        if self._selector is not None:
+            self._selector.unregister(self.connection)
+            self._selector.register(self._socket, selectors.EVENT_READ)
+        self.connection.close()
+        self.connection = None
+
     def is_grayscale_image(self, frame):
         """
         Determines if the provided image frame is predominantly grayscale while
@@ -172,10 +221,22 @@ class WorkerDeviceLaunchMonitorRelayServer(WorkerBase):
         Returns:
             bool: True if the image is grayscale, False otherwise.
         """
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        mean_saturation = float(np.mean(hsv[:, :, 1]))
-        logging.debug(f'{self.name}: Mean saturation = {mean_saturation:.2f}')
-        self.saturationChanged.emit(mean_saturation)
+        # HSV saturation is (max - min) / max of the colour channels, scaled to 0..255 like OpenCV,
+        # so it is computed directly on a subsample instead of converting the whole frame
+        stride = self.saturation_sample_stride
+        sample = frame[::stride, ::stride, :3]
+        highest = sample.max(axis=2).astype(np.float32)
+        saturation = highest - sample.min(axis=2)
+        # Work in place and apply the 255 scale once to the mean rather than to every pixel
+        np.maximum(highest, 1.0, out=highest)
+        saturation /= highest
+        mean_saturation = float(saturation.mean()) * 255.0
+        # Each emit is queued across to the GUI thread, skip values the display would not show as different
+        last = self._last_emitted_saturation
+        if last is None or abs(mean_saturation - last) >= self.saturation_emit_step:
+            self._last_emitted_saturation = mean_saturation
+            logging.debug('%s: Mean saturation = %.2f', self.name, mean_saturation)
+            self.saturationChanged.emit(mean_saturation)
         return mean_saturation < self.saturation_threshold
 
     def __load_capture_region(self):
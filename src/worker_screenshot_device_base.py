@@ -1,5 +1,7 @@
 import logging
-from datetime import datetime
+import time
+from collections import namedtuple
+from operator import attrgetter
 
 from PySide6.QtCore import Signal
 
@@ -7,6 +9,21 @@ from src.ball_data import BallData, BallMetrics
 from src.settings import Settings
 from src.worker_base import WorkerBase
 
+# Ball metrics blanked on a delayed club data pass, only the club path and angle of attack are kept
+_PARTIAL_CLEARED_METRICS = tuple(
+    metric for metric in BallData.properties
+    if metric not in (BallMetrics.CLUB_PATH, BallMetrics.ANGLE_OF_ATTACK)
+)
+
+# Read only snapshot of a shot's metrics sent with partial updates, the receivers only read
+# the metric attributes so there is no need to copy the whole BallData
+PartialMetrics = namedtuple('PartialMetrics', BallData.properties)
+_metric_values = attrgetter(*BallData.properties)
+
+
+def _partial_metrics(balldata: BallData) -> PartialMetrics:
+    return PartialMetrics._make(_metric_values(balldata))
+
 
 class WorkerScreenshotBase(WorkerBase):
     shot = Signal(object or None)
@@ -20,7 +37,7 @@ class WorkerScreenshotBase(WorkerBase):
         super(WorkerScreenshotBase, self).__init__()
         self.shot_count = 0
         self.settings = settings
-        self.time_of_last_shot = datetime.now()
+        self.time_of_last_shot = time.monotonic()
         self.name = 'WorkerScreenshotDeviceBase'
 
     def do_screenshot(
@@ -34,83 +51,80 @@ class WorkerScreenshotBase(WorkerBase):
     ):
         # Grab sreenshot and process data, checks if this is a new shot
         screenshot.capture_screenshot(settings, rois_setup)
-        if screenshot.screenshot_new:
-            screenshot.ocr_image(
-                include_club_metrics=include_club_metrics,
-                include_non_club_metrics=include_non_club_metrics,
-            )
-            if partial_only:
-                # Treat this capture as a supplemental update for the prior shot.
-                screenshot.partial_update = True
-                screenshot.new_shot = False
-                screenshot.balldata.include_ball_data = False
-                screenshot.balldata.include_club_data = True
-                screenshot.balldata.reuse_last_shot_number = True
+        if not screenshot.screenshot_new:
+            if getattr(screenshot, 'partial_update', False):
+                self.metrics.emit(_partial_metrics(screenshot.balldata), True)
+            self.same_shot.emit()
+            return
+        screenshot.ocr_image(
+            include_club_metrics=include_club_metrics,
+            include_non_club_metrics=include_non_club_metrics,
+        )
+        if partial_only:
+            # Treat this capture as a supplemental update for the prior shot.
+            balldata = screenshot.balldata
+            invalid_value = BallData.invalid_value
+            screenshot.partial_update = True
+            screenshot.new_shot = False
+            balldata.include_ball_data = False
+            balldata.include_club_data = True
+            balldata.reuse_last_shot_number = True
 
-                # When the delayed overlay reuses the Spin Axis slot to display
-                # Angle of Attack, move the value over and prevent spin-axis
-                # overwrites on the history table.
-                spin_axis_value = getattr(
-                    screenshot.balldata, BallMetrics.SPIN_AXIS, BallData.invalid_value
-                )
-                aoa_value = getattr(
-                    screenshot.balldata, BallMetrics.ANGLE_OF_ATTACK, BallData.invalid_value
-                )
-                spin_axis_overlay_value = (
-                    spin_axis_value not in (None, "", BallData.invalid_value)
-                    and spin_axis_value != 0
-                    and abs(spin_axis_value) <= 25
-                )
-                if aoa_value in (None, "", BallData.invalid_value, 0) and spin_axis_overlay_value:
-                    setattr(screenshot.balldata, BallMetrics.ANGLE_OF_ATTACK, spin_axis_value)
-                setattr(screenshot.balldata, BallMetrics.SPIN_AXIS, BallData.invalid_value)
+            # When the delayed overlay reuses the Spin Axis slot to display
+            # Angle of Attack, move the value over and prevent spin-axis
+            # overwrites on the history table.
+            spin_axis_value = balldata.spin_axis
+            aoa_value = balldata.angle_of_attack
+            spin_axis_overlay_value = (
+                spin_axis_value not in (None, "", invalid_value)
+                and spin_axis_value != 0
+                and abs(spin_axis_value) <= 25
+            )
+            if aoa_value in (None, "", invalid_value, 0) and spin_axis_overlay_value:
+                balldata.angle_of_attack = spin_axis_value
+            balldata.spin_axis = invalid_value
 
-                # Ignore any ball metrics from this overlay so the UI and GSPro
-                # refreshes only consider the delayed club data.
-                for metric in BallData.properties:
-                    if metric in (BallMetrics.CLUB_PATH, BallMetrics.ANGLE_OF_ATTACK):
-                        continue
-                    setattr(screenshot.balldata, metric, BallData.invalid_value)
-                logging.debug(
-                    "Partial club-data pass prepared: path=%s, aoa=%s, include_ball_data=%s, include_club_data=%s",
-                    getattr(screenshot.balldata, BallMetrics.CLUB_PATH, None),
-                    getattr(screenshot.balldata, BallMetrics.ANGLE_OF_ATTACK, None),
-                    screenshot.balldata.include_ball_data,
-                    screenshot.balldata.include_club_data,
-                )
-            if screenshot.new_shot:
-                if screenshot.balldata.good_shot:
-                    # If we receive more than 1 shot in 5 seconds assume it's a ghost shot
-                    # so ignore, if we receive more than 2 shots display warning to user to set
-                    # camera to stationary
-                    last_shot_seconds = (datetime.now() - self.time_of_last_shot).seconds
-                    if last_shot_seconds <= 5:
-                        self.shot_count = self.shot_count + 1
-                    else:
-                        self.shot_count = 0
-                    self.time_of_last_shot = datetime.now()
-                    if self.shot_count >= 1:
-                        self.same_shot.emit()
-                        logging.info(f"Process {self.name} shot received within 5 seconds of last shot, assuming ghost shot ignoring")
-                        # Ghost ignore
-                        if self.shot_count > 2:
-                            # More than 3 ghosts display camera settings warning
-                            logging.info(f"Process {self.name} more than 2 shots received within 5 seconds of last shot, warn user to change camera setting")
-                            self.too_many_ghost_shots.emit()
-                            self.shot_count = 0
-                    else:
-                        logging.info(f"Process {self.name} good shot send to GSPro")
-                        self.shot.emit(screenshot.balldata)
-                else:
-                    logging.info(
-                        f"Process {self.name} bad shot data: {screenshot.balldata.to_json()}, errors: {screenshot.balldata.errors}")
-                    self.bad_shot.emit(screenshot.balldata)
-            else:
-                logging.info(f"Process {self.name} same shot do not send to GSPro")
-                if getattr(screenshot, 'partial_update', False):
-                    self.metrics.emit(screenshot.balldata.__copy__(), True)
-                self.same_shot.emit()
-        else:
+            # Ignore any ball metrics from this overlay so the UI and GSPro
+            # refreshes only consider the delayed club data.
+            for metric in _PARTIAL_CLEARED_METRICS:
+                setattr(balldata, metric, invalid_value)
+            logging.debug(
+                "Partial club-data pass prepared: path=%s, aoa=%s, include_ball_data=%s, include_club_data=%s",
+                balldata.path,
+                balldata.angle_of_attack,
+                balldata.include_ball_data,
+                balldata.include_club_data,
+            )
+        if not screenshot.new_shot:
+            logging.info(f"Process {self.name} same shot do not send to GSPro")
             if getattr(screenshot, 'partial_update', False):
-                self.metrics.emit(screenshot.balldata.__copy__(), True)
+                self.metrics.emit(_partial_metrics(screenshot.balldata), True)
             self.same_shot.emit()
+            return
+        balldata = screenshot.balldata
+        if not balldata.good_shot:
+            logging.info(
+                f"Process {self.name} bad shot data: {balldata.to_json()}, errors: {balldata.errors}")
+            self.bad_shot.emit(balldata)
+            return
+        # If we receive more than 1 shot in 5 seconds assume it's a ghost shot
+        # so ignore, if we receive more than 2 shots display warning to user to set
+        # camera to stationary
+        now = time.monotonic()
+        if now - self.time_of_last_shot <= 5:
+            self.shot_count = self.shot_count + 1
+        else:
+            self.shot_count = 0
+        self.time_of_last_shot = now
+        if self.shot_count < 1:
+            logging.info(f"Process {self.name} good shot send to GSPro")
+            self.shot.emit(balldata)
+            return
+        self.same_shot.emit()
+        logging.info(f"Process {self.name} shot received within 5 seconds of last shot, assuming ghost shot ignoring")
+        # Ghost ignore
+        if self.shot_count > 2:
+            # More than 3 ghosts display camera settings warning
+            logging.info(f"Process {self.name} more than 2 shots received within 5 seconds of last shot, warn user to change camera setting")
+            self.too_many_ghost_shots.emit()
+            self.shot_count = 0
@@ -1,21 +1,13 @@
 import logging
 import time
-import cv2
 import numpy as np
-from mss import mss
 from threading import Event
 
-# OBS WebSocket imports
-from obswebsocket import obsws, requests
-
 from src.device import Device
 from src.screenshot import Screenshot
 from src.worker_screenshot_device_base import WorkerScreenshotBase
 from src.settings import Settings
 
-# Import Signal from PySide6
-from PySide6.QtCore import Signal
-
 # --------------------------------------------------
 # Configuration for Screen Region
 # --------------------------------------------------
@@ -25,6 +17,8 @@ CAPTURE_REGION = {
     "width": 86,   # (3900 - 3814)
     "height": 236  # (250 - 14)
 }
+# Only every CAPTURE_STRIDE-th pixel in each direction is used for the mean saturation
+CAPTURE_STRIDE = 4
 
 # --------------------------------------------------
 # OBS WebSocket Configuration
@@ -41,24 +35,41 @@ HOTKEY_MODIFIERS = {
 }
 WAIT_AFTER_GRAYSCALE = 2.5  # seconds to wait before triggering OBS hotkey
 CLUB_SCAN_TIMEOUT = 6.0  # seconds to wait for delayed club metrics before pausing
+IDLE_BACKOFF_STEP = 0.5  # extra screenshot intervals added per steady pause tick
+IDLE_BACKOFF_MAX_TICKS = 6  # caps the steady pause wait at 4x the screenshot interval
 
 # --------------------------------------------------
 # Helper Function
 # --------------------------------------------------
-def get_mean_saturation(frame):
+def get_mean_saturation(frame, scratch=None):
     """
-    Convert the provided BGR frame to HSV and return the mean saturation.
-    If conversion fails, returns None.
+    Return the mean HSV saturation of the provided BGR frame.
+    scratch can hold two float32 arrays the size of the frame that are reused
+    between calls instead of allocating new ones.
+    If the computation fails, returns None.
     """
     try:
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        mean_saturation = np.mean(hsv[:, :, 1])
+        # Only the S channel is needed, (max - min) / max scaled to 0..255 as OpenCV does,
+        # so hue and value are never computed
+        if scratch is None:
+            scratch = new_saturation_scratch(frame.shape[0], frame.shape[1])
+        highest, saturation = scratch
+        np.max(frame, axis=2, out=highest)
+        np.min(frame, axis=2, out=saturation)
+        np.subtract(highest, saturation, out=saturation)
+        np.maximum(highest, 1.0, out=highest)
+        np.divide(saturation, highest, out=saturation)
+        mean_saturation = float(saturation.mean()) * 255.0
         return mean_saturation
     except Exception as e:
         logging.error(f"Error computing mean saturation: {e}")
         return None
 
 
+def new_saturation_scratch(height, width):
+    return np.empty((height, width), np.float32), np.empty((height, width), np.float32)
+
+
 # --------------------------------------------------
 # Worker Class
 # --------------------------------------------------
@@ -77,9 +88,6 @@ class WorkerScreenshotDeviceLaunchMonitor(WorkerScreenshotBase):
     A state variable is used to avoid repeated triggering of the same action unnecessarily.
     """
 
-    # Define a new signal to emit the current saturation (float value)
-    saturationChanged = Signal(float)
-
     def __init__(self, settings: Settings, main_window):
         super().__init__(settings)
         self.main_window = main_window  # Reference to MainWindow for dynamic thresholds
@@ -89,8 +97,32 @@ class WorkerScreenshotDeviceLaunchMonitor(WorkerScreenshotBase):
         self.name = 'WorkerScreenshotDeviceLaunchMonitor'
         self._club_scan_started_at = None
         self._club_scan_timed_out = False
+        # Latest mean saturation, polled by the main window for its display
+        self.latest_saturation = None
+        # Screenshot interval in seconds, it is not a user setting so it never changes while running
+        self._sleep_s = settings.screenshot_interval / 1000
+        # Thresholds are pushed in by the main window when a slider moves
+        self._shot_threshold = float(main_window.current_saturation_threshold)
+        self._obs_threshold = float(main_window.current_obs_threshold)
+        self._hotkey_deadline = None
+        # Indexed by saturation band, each handler returns the new loop state
+        self._band_handlers = (self.__shot_band, self.__hotkey_band, self.__pause_band)
+        # Reused by get_mean_saturation on every capture
+        self._saturation_scratch = new_saturation_scratch(
+            -(-CAPTURE_REGION["height"] // CAPTURE_STRIDE),
+            -(-CAPTURE_REGION["width"] // CAPTURE_STRIDE)
+        )
+
+    def set_thresholds(self, shot_threshold: float, obs_threshold: float):
+        # Called directly from the GUI thread, run() blocks this worker's own event loop
+        self._shot_threshold = shot_threshold
+        self._obs_threshold = obs_threshold
 
     def run(self):
+        # Screen capture and OBS are only needed once the worker runs,
+        # importing them here keeps them out of the application's start up
+        from mss import mss
+        from obswebsocket import obsws
         self.started.emit()
         logging.debug(f"{self.name} started.")
 
@@ -106,123 +138,52 @@ class WorkerScreenshotDeviceLaunchMonitor(WorkerScreenshotBase):
         # State variable to avoid repeated triggers.
         # Possible states: "shot", "hotkey", "pause", or None.
         last_state = None
+        # When the pending OBS hotkey is due, the loop keeps sampling until then.
+        self._hotkey_deadline = None
+        # Ticks spent paused in a row, the loop samples less often the longer nothing changes.
+        stable_ticks = 0
+        wait_s = self._sleep_s
 
         with mss() as sct:
-            while not self._shutdown.is_set():
-                # Wait for the configured screenshot interval (milliseconds to seconds).
-                time.sleep(self.settings.screenshot_interval / 1000)
+            # Wait for the configured screenshot interval, waking straight away on shutdown.
+            while not self._shutdown.wait(wait_s):
+                if self._hotkey_deadline is not None and time.monotonic() >= self._hotkey_deadline:
+                    self._hotkey_deadline = None
+                    self.__trigger_obs_hotkey(ws)
 
                 if self.device is None:
                     continue
 
                 # Capture the defined screen region.
                 sct_img = sct.grab(CAPTURE_REGION)
-                frame = np.array(sct_img)[:, :, :3]  # Discard alpha channel if present.
+                # View mss's BGRA buffer in place, sampling every CAPTURE_STRIDE-th pixel
+                # and skipping the alpha channel, no copy is made.
+                frame = np.frombuffer(sct_img.raw, dtype=np.uint8).reshape(sct_img.height, sct_img.width, 4)
+                frame = frame[::CAPTURE_STRIDE, ::CAPTURE_STRIDE, :3]
 
                 # Compute the mean saturation.
-                mean_saturation = get_mean_saturation(frame)
+                mean_saturation = get_mean_saturation(frame, self._saturation_scratch)
                 if mean_saturation is None:
                     continue  # Skip this iteration if saturation could not be computed.
-                logging.debug(f"Mean saturation: {mean_saturation:.2f}")
-
-                # Emit the current saturation so the main window can update its display.
-                self.saturationChanged.emit(mean_saturation)
-
-                # Get dynamic thresholds from the main window.
-                shot_threshold = self.main_window.current_saturation_threshold
-                obs_high_threshold = self.main_window.current_obs_threshold
-
-                # --- Modified Logic for Continual Shot Capture ---
-                # If saturation is below the shot data threshold, resume (if paused) and capture shot data.
-                if mean_saturation < shot_threshold:
-                    self._club_scan_started_at = None
-                    self._club_scan_timed_out = False
-                    # If the reading is 0, the numbers haven't populated yet—skip capture.
-                    if mean_saturation == 0:
-                        logging.debug("Saturation reading is 0; shot data not yet populated. Waiting for valid readings.")
-                        continue
-                    if last_state == "pause":
-                        logging.debug("Saturation below shot threshold: resuming ball data capture.")
-                        self.resume()
-                    # Always capture a new shot (continuously) when in shot mode.
-                    logging.debug(f"Saturation ({mean_saturation:.2f}) is below dynamic shot threshold ({shot_threshold}): capturing new shot and feeding data.")
-                    try:
-                        self.do_screenshot(
-                            self.screenshot,
-                            self.device,
-                            False,
-                            include_club_metrics=False,
-                        )
-                    except Exception as e:
-                        logging.error(f"Error capturing shot: {e}")
-                    last_state = "shot"
-
-                # If saturation is between the shot data threshold and the OBS threshold, trigger OBS hotkey.
-                elif shot_threshold <= mean_saturation <= obs_high_threshold:
-                    if self._club_scan_timed_out:
-                        if mean_saturation < shot_threshold or mean_saturation > obs_high_threshold:
-                            self._club_scan_timed_out = False
-                            self._club_scan_started_at = None
-                        else:
-                            if last_state != "pause":
-                                logging.debug(
-                                    "Timed out waiting for club data; pausing until saturation leaves the club-metric window."
-                                )
-                                self.pause()
-                                last_state = "pause"
-                            continue
-
-                    if self._club_scan_started_at is None:
-                        self._club_scan_started_at = time.time()
-                    elif time.time() - self._club_scan_started_at > CLUB_SCAN_TIMEOUT:
-                        logging.debug(
-                            f"Exceeded club-data wait window ({CLUB_SCAN_TIMEOUT}s); pausing until saturation changes."
-                        )
-                        self._club_scan_timed_out = True
-                        self.pause()
-                        last_state = "pause"
-                        continue
-
-                    if last_state != "hotkey":
-                        logging.debug(f"Saturation ({mean_saturation:.2f}) is between shot threshold ({shot_threshold}) and dynamic OBS threshold ({obs_high_threshold}): triggering OBS hotkey.")
-                        logging.debug(f"Waiting {WAIT_AFTER_GRAYSCALE} seconds before triggering OBS hotkey...")
-                        time.sleep(WAIT_AFTER_GRAYSCALE)
-                        if ws is not None:
-                            try:
-                                ws.call(requests.TriggerHotkeyByKeySequence(
-                                    keyId=HOTKEY_KEYID,
-                                    keyModifiers=HOTKEY_MODIFIERS
-                                ))
-                                logging.debug("OBS hotkey triggered.")
-                            except Exception as e:
-                                logging.error(f"Failed to trigger OBS hotkey: {e}")
-                        else:
-                            logging.warning("OBS WebSocket not connected; skipping hotkey trigger.")
-                        last_state = "hotkey"
-                    try:
-                        # Capture late-arriving club metrics while the overlay is visible
-                        # without generating a new shot.
-                        logging.debug(
-                            "Initiating delayed club-metric OCR pass (path/angle_of_attack) while overlay is visible."
-                        )
-                        self.do_screenshot(
-                            self.screenshot,
-                            self.device,
-                            False,
-                            partial_only=True,
-                            include_non_club_metrics=False,
-                        )
-                    except Exception as e:
-                        logging.error(f"Error capturing delayed club metrics: {e}")
-
-                # If saturation is above the OBS threshold, pause ball data capture.
-                else:  # mean_saturation > obs_high_threshold
-                    self._club_scan_started_at = None
-                    self._club_scan_timed_out = False
-                    if last_state != "pause":
-                        logging.debug(f"Saturation ({mean_saturation:.2f}) is above dynamic OBS threshold ({obs_high_threshold}): pausing ball data capture.")
-                        self.pause()
-                        last_state = "pause"
+                # The main window reads this on its own timer, nothing is queued to the GUI thread per tick.
+                self.latest_saturation = mean_saturation
+
+                # Pick the saturation band: 0 = shot data, 1 = OBS hotkey / club metrics, 2 = pause.
+                if mean_saturation < self._shot_threshold:
+                    band = 0
+                elif mean_saturation <= self._obs_threshold:
+                    band = 1
+                else:
+                    band = 2
+                state = self._band_handlers[band](mean_saturation, last_state)
+                if state == "pause" and last_state == "pause":
+                    if stable_ticks < IDLE_BACKOFF_MAX_TICKS:
+                        stable_ticks += 1
+                        wait_s = self._sleep_s * (1 + stable_ticks * IDLE_BACKOFF_STEP)
+                elif stable_ticks:
+                    stable_ticks = 0
+                    wait_s = self._sleep_s
+                last_state = state
 
         # Disconnect from OBS WebSocket if connected.
         if ws is not None:
@@ -230,6 +191,102 @@ class WorkerScreenshotDeviceLaunchMonitor(WorkerScreenshotBase):
             logging.info("Disconnected from OBS WebSocket.")
         self.finished.emit()
 
+    def __shot_band(self, mean_saturation, last_state):
+        # Below the shot data threshold, resume (if paused) and capture shot data.
+        self.__clear_club_scan()
+        # If the reading is 0, the numbers haven't populated yet—skip capture.
+        if mean_saturation == 0:
+            logging.debug("Saturation reading is 0; shot data not yet populated. Waiting for valid readings.")
+            return last_state
+        if last_state == "pause":
+            logging.debug("Saturation below shot threshold: resuming ball data capture.")
+            self.resume()
+        # Always capture a new shot (continuously) when in shot mode.
+        logging.debug(f"Saturation ({mean_saturation:.2f}) is below dynamic shot threshold ({self._shot_threshold}): capturing new shot and feeding data.")
+        try:
+            self.do_screenshot(
+                self.screenshot,
+                self.device,
+                False,
+                include_club_metrics=False,
+            )
+        except Exception as e:
+            logging.error(f"Error capturing shot: {e}")
+        return "shot"
+
+    def __hotkey_band(self, mean_saturation, last_state):
+        # Between the shot data threshold and the OBS threshold, trigger the OBS hotkey.
+        if self._club_scan_timed_out:
+            if last_state != "pause":
+                logging.debug(
+                    "Timed out waiting for club data; pausing until saturation leaves the club-metric window."
+                )
+                self.pause()
+            return "pause"
+
+        if self._club_scan_started_at is None:
+            self._club_scan_started_at = time.monotonic()
+        elif time.monotonic() - self._club_scan_started_at > CLUB_SCAN_TIMEOUT:
+            logging.debug(
+                f"Exceeded club-data wait window ({CLUB_SCAN_TIMEOUT}s); pausing until saturation changes."
+            )
+            self._club_scan_timed_out = True
+            self.pause()
+            return "pause"
+
+        if last_state != "hotkey":
+            logging.debug(f"Saturation ({mean_saturation:.2f}) is between shot threshold ({self._shot_threshold}) and dynamic OBS threshold ({self._obs_threshold}): triggering OBS hotkey.")
+            logging.debug(f"Waiting {WAIT_AFTER_GRAYSCALE} seconds before triggering OBS hotkey...")
+            self._hotkey_deadline = time.monotonic() + WAIT_AFTER_GRAYSCALE
+        if self._hotkey_deadline is not None:
+            # The overlay is still settling, only read the club metrics once the wait is over.
+            return "hotkey"
+        try:
+            # Capture late-arriving club metrics while the overlay is visible
+            # without generating a new shot.
+            logging.debug(
+                "Initiating delayed club-metric OCR pass (path/angle_of_attack) while overlay is visible."
+            )
+            self.do_screenshot(
+                self.screenshot,
+                self.device,
+                False,
+                partial_only=True,
+                include_non_club_metrics=False,
+            )
+        except Exception as e:
+            logging.error(f"Error capturing delayed club metrics: {e}")
+        return "hotkey"
+
+    def __clear_club_scan(self):
+        # Runs every tick in the shot and pause bands, only write when there is a scan to clear
+        if self._club_scan_started_at is not None or self._club_scan_timed_out:
+            self._club_scan_started_at = None
+            self._club_scan_timed_out = False
+
+    def __pause_band(self, mean_saturation, last_state):
+        # Above the OBS threshold, pause ball data capture.
+        self.__clear_club_scan()
+        if last_state != "pause":
+            logging.debug(f"Saturation ({mean_saturation:.2f}) is above dynamic OBS threshold ({self._obs_threshold}): pausing ball data capture.")
+            self.pause()
+        return "pause"
+
+    def __trigger_obs_hotkey(self, ws):
+        if ws is None:
+            logging.warning("OBS WebSocket not connected; skipping hotkey trigger.")
+            return
+        # Already loaded by run() when it connected
+        from obswebsocket import requests
+        try:
+            ws.call(requests.TriggerHotkeyByKeySequence(
+                keyId=HOTKEY_KEYID,
+                keyModifiers=HOTKEY_MODIFIERS
+            ))
+            logging.debug("OBS hotkey triggered.")
+        except Exception as e:
+            logging.error(f"Failed to trigger OBS hotkey: {e}")
+
     def change_device(self, device: Device):
         self.device = device
         self.screenshot.update_rois(self.device.rois)